@@ -2,25 +2,56 @@ import subprocess
 import sys
 import importlib.metadata
 import logging
+import logging.handlers
+import queue
 from simple_term_menu import TerminalMenu
 from colorama import init, Fore, Style
 import os
 import concurrent.futures
+import itertools
+import functools
+import asyncio
+import tempfile
+import threading
 from typing import List, Tuple, Optional, Dict
-import json
-from datetime import datetime, timedelta
+import atexit
+import orjson
+import time
+import sqlite3
+import requests
+from requests.adapters import HTTPAdapter
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 # Initialize colorama
 init()
 
-# Set up logging
-logging.basicConfig(filename='package_manager.log', level=logging.INFO,
+# Set up logging; records are queued and written to the log file by a background listener thread
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, logging.FileHandler('package_manager.log'))
+log_listener.start()
+atexit.register(log_listener.stop)
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)],
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
 # Constants
-CACHE_FILE = 'package_cache.json'
-CACHE_EXPIRY = timedelta(hours=1)
+CACHE_FILE = 'package_cache.db'
+CACHE_EXPIRY_SECONDS = 3600.0
 MAX_WORKERS = 20
+PYPI_JSON_URL = 'https://pypi.org/pypi/{}/json'
+PYPI_TIMEOUT = 5
+PYPI_INDEX_URLS = {'https://pypi.org/simple', 'https://pypi.python.org/simple'}
+ASYNC_CONNECTION_LIMIT = 64
 
 # Menu styling
 MENU_STYLE = {
@@ -35,91 +66,268 @@ MENU_STYLE = {
 class PackageCache:
     def __init__(self, cache_file: str):
         self.cache_file = cache_file
-        self.cache = self.load()
-
-    def load(self) -> Dict[str, Dict]:
-        """Load the package information cache from file."""
-        if os.path.exists(self.cache_file):
-            with open(self.cache_file, 'r') as f:
-                return json.load(f)
-        return {}
+        # Autocommit mode: each single-row update is written on its own
+        self.conn = sqlite3.connect(cache_file, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (name TEXT PRIMARY KEY, latest TEXT, all_versions BLOB, ts REAL)"
+        )
 
-    def save(self) -> None:
-        """Save the package information cache to file."""
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.cache, f)
+    def close(self) -> None:
+        """Close the cache database."""
+        self.conn.close()
 
     def get(self, package_name: str) -> Optional[Dict]:
         """Get package info from cache if it's not expired."""
-        if package_name in self.cache:
-            cached_time = datetime.fromisoformat(self.cache[package_name]['timestamp'])
-            if datetime.now() - cached_time < CACHE_EXPIRY:
-                return self.cache[package_name]
-        return None
+        row = self.conn.execute(
+            "SELECT latest, all_versions, ts FROM cache WHERE name = ?", (package_name,)
+        ).fetchone()
+        if not row or time.time() - row[2] >= CACHE_EXPIRY_SECONDS:
+            return None
+
+        info = {"latest_version": row[0], "timestamp": row[2]}
+        if row[1] is not None:
+            info["all_versions"] = orjson.loads(row[1])
+        return info
+
+    def get_latest_versions(self) -> Dict[str, str]:
+        """Get the latest version of every package whose cache entry has not expired, without decoding version lists."""
+        rows = self.conn.execute(
+            "SELECT name, latest FROM cache WHERE ts > ?", (time.time() - CACHE_EXPIRY_SECONDS,)
+        )
+        return dict(rows)
 
     def set(self, package_name: str, info: Dict) -> None:
         """Set package info in cache with current timestamp."""
-        info['timestamp'] = datetime.now().isoformat()
-        self.cache[package_name] = info
-        self.save()
+        self.set_many({package_name: info})
+
+    def set_many(self, items: Dict[str, Dict]) -> None:
+        """Set info for several packages at once in a single transaction."""
+        timestamp = time.time()
+        rows = [(name, info['latest_version'],
+                 orjson.dumps(info['all_versions']) if 'all_versions' in info else None, timestamp)
+                for name, info in items.items()]
+        self.conn.execute("BEGIN")
+        try:
+            self.conn.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)", rows)
+            self.conn.execute("COMMIT")
+        except sqlite3.Error:
+            self.conn.execute("ROLLBACK")
+            raise
 
 
 class PackageManager:
     def __init__(self):
         self.cache = PackageCache(CACHE_FILE)
+        atexit.register(self.cache.close)
+        # One pooled session shared by all worker threads keeps connections alive between lookups
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+        self._session.mount('https://', adapter)
+        self._installed_by_name: Dict[str, str] = {}
+        # Formatted menu line per package name, keyed by the values it was built from
+        self._format_cache: Dict[str, Tuple[Tuple, str]] = {}
+        # Successful single PyPI lookups; failures are not stored so they are retried next time
+        self._pypi_info_memo: Dict[str, Dict] = {}
+        # Installed packages and the menu built from them are kept until a pip action changes the environment
+        self._packages: List[importlib.metadata.Distribution] = []
+        self._packages_dirty = True
+        self._menu_packages: Optional[List[importlib.metadata.Distribution]] = None
+        self._menu_items: List[str] = []
+        self._package_info: List[Tuple[str, str, Optional[str]]] = []
 
     def get_installed_packages(self) -> List[importlib.metadata.Distribution]:
         """Retrieve a list of installed Python packages."""
-        return list(importlib.metadata.distributions())
+        if not self._packages_dirty:
+            return self._packages
+
+        paths = list(dict.fromkeys(sys.path))
+        workers = max(1, min(len(paths), os.cpu_count() or 1))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            scanned = executor.map(lambda path: list(importlib.metadata.distributions(path=[path])), paths)
+            distributions = list(itertools.chain.from_iterable(scanned))
+
+        packages = []
+        self._installed_by_name = {}
+        for package in distributions:
+            # The first distribution found on sys.path shadows later ones
+            name, version = distribution_details(package)
+            if name not in self._installed_by_name:
+                self._installed_by_name[name] = version
+                packages.append(package)
+
+        self._packages = packages
+        self._packages_dirty = False
+        return packages
+
+    def _invalidate(self, package_name: str) -> None:
+        """Forget installed package state after `package_name` has been changed."""
+        self._packages_dirty = True
+        self._installed_by_name.clear()
+        self._format_cache.pop(package_name, None)
+        self._pypi_info_memo.clear()
+
+    def get_pypi_info(self, package_name: str, not_found: Optional[set] = None) -> Optional[Dict]:
+        """Fetch package information from the PyPI JSON API.
+
+        Packages unknown to PyPI are looked up with `pip index` when pip is configured with another index, unless a
+        `not_found` set is given, in which case their names are added to it so the caller can resolve them in one
+        batch. Successful single lookups are memoized for the lifetime of the manager.
+        """
+        if not_found is not None:
+            return self._request_pypi_info(package_name, not_found)
+
+        pypi_info = self._pypi_info_memo.get(package_name)
+        if pypi_info is None:
+            pypi_info = self._request_pypi_info(package_name)
+            if pypi_info is not None:
+                self._pypi_info_memo[package_name] = pypi_info
+        return pypi_info
+
+    def _request_pypi_info(self, package_name: str, not_found: Optional[set] = None) -> Optional[Dict]:
+        """Uncached implementation of `get_pypi_info`."""
+        try:
+            response = self._session.get(PYPI_JSON_URL.format(package_name), timeout=PYPI_TIMEOUT)
+            if response.status_code == 404:
+                if not_found is not None:
+                    not_found.add(package_name)
+                    return None
+                return self.get_pip_index_info(package_name) if pip_has_extra_index() else None
+            response.raise_for_status()
+            return parse_pypi_json(response.content)
+        except (requests.RequestException, ValueError) as e:
+            logging.error(f"Failed to fetch PyPI info for {package_name}: {str(e)}")
+            return None
+
+    def fetch_pypi_info(self, package_names: List[str]) -> Dict[str, Dict]:
+        """Fetch PyPI information for several packages concurrently."""
+        not_found: set = set()
+        if aiohttp is not None:
+            fetched = asyncio.run(self._fetch_all(package_names, not_found))
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                results = list(executor.map(lambda name: self.get_pypi_info(name, not_found), package_names))
+            fetched = {name: info for name, info in zip(package_names, results) if info}
+
+        # Checked once after the fan-out, since it may spawn pip
+        if not_found and pip_has_extra_index():
+            fetched.update(self.get_pip_report_info(sorted(not_found)))
+        return fetched
+
+    async def _fetch_all(self, package_names: List[str], not_found: set) -> Dict[str, Dict]:
+        """Fetch PyPI information for all packages over a single aiohttp session."""
+        connector = aiohttp.TCPConnector(limit=ASYNC_CONNECTION_LIMIT)
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=PYPI_TIMEOUT, sock_read=PYPI_TIMEOUT)
+        # trust_env picks up proxy and netrc settings the same way the requests fallback does
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, trust_env=True) as session:
+            results = await asyncio.gather(*[self._fetch_one(session, name, not_found) for name in package_names])
+        return {name: info for name, info in zip(package_names, results) if info}
+
+    async def _fetch_one(self, session: "aiohttp.ClientSession", package_name: str,
+                         not_found: set) -> Optional[Dict]:
+        """Async counterpart of `get_pypi_info`."""
+        try:
+            async with session.get(PYPI_JSON_URL.format(package_name)) as response:
+                if response.status == 404:
+                    not_found.add(package_name)
+                    return None
+                response.raise_for_status()
+                return parse_pypi_json(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logging.error(f"Failed to fetch PyPI info for {package_name}: {str(e)}")
+            return None
 
-    def get_pypi_info(self, package_name: str) -> Optional[Dict]:
-        """Fetch package information from PyPI."""
+    def get_pip_index_info(self, package_name: str) -> Optional[Dict]:
+        """Fetch package information with `pip index`, honouring any extra indexes pip is configured with."""
         try:
             output = subprocess.check_output([sys.executable, '-m', 'pip', 'index', 'versions', package_name],
                                              stderr=subprocess.DEVNULL)
-            versions = output.decode().split('Available versions: ')[-1].strip().split(', ')
+            versions = output.decode().split('Available versions: ')[-1].splitlines()[0].strip().split(', ')
             return {"latest_version": versions[0], "all_versions": versions} if versions else None
         except subprocess.CalledProcessError:
             return None
 
-    def get_package_info(self, package: importlib.metadata.Distribution) -> Tuple[str, str, Optional[str]]:
-        """Fetch or retrieve from cache the package information."""
-        name = package.metadata['Name']
-        installed_version = package.version
+    def get_pip_report_info(self, package_names: List[str]) -> Dict[str, Dict]:
+        """Resolve the latest versions of several packages with a single `pip install --dry-run` call.
 
-        pypi_info = self.cache.get(name)
-        if not pypi_info:
-            pypi_info = self.get_pypi_info(name)
+        Only the latest version is known for packages resolved this way. Packages missing from the report, or all
+        of them if pip fails, are looked up one by one with `pip index`. Note that `--dry-run` still downloads each
+        distribution and may have to build metadata for sdists.
+        """
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as requirements_file:
+            requirements_file.write('\n'.join(package_names))
+        try:
+            result = subprocess.run(
+                [sys.executable, '-m', 'pip', 'install', '--dry-run', '--ignore-installed', '--no-deps', '--quiet',
+                 '--report', '-', '-r', requirements_file.name],
+                check=True,
+                capture_output=True
+            )
+            report = orjson.loads(result.stdout)
+        except (subprocess.CalledProcessError, ValueError) as e:
+            logging.error(f"Failed to resolve latest versions with pip: {str(e)}")
+            report = {}
+        finally:
+            os.remove(requirements_file.name)
+
+        latest_versions = {canonicalize_name(item['metadata']['name']): item['metadata']['version']
+                           for item in report.get('install', [])}
+        fetched = {}
+        for name in package_names:
+            latest_version = latest_versions.get(canonicalize_name(name))
+            pypi_info = {"latest_version": latest_version} if latest_version else self.get_pip_index_info(name)
             if pypi_info:
-                self.cache.set(name, pypi_info)
-
-        latest_version = pypi_info['latest_version'] if pypi_info else None
-        return (name, installed_version, latest_version)
+                fetched[name] = pypi_info
+        return fetched
 
     def display_packages(self, packages: List[importlib.metadata.Distribution]) -> List[str]:
         """Create a formatted list of packages for display in the menu."""
+        if packages is self._menu_packages:
+            return self._menu_items
+
         print("Fetching package information...")
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            package_info = list(executor.map(self.get_package_info, packages))
+        details = [distribution_details(package) for package in packages]
+        local_names = {name for (name, _), package in zip(details, packages) if is_local_install(package)}
+        names = dict.fromkeys(name for name, _ in details if name not in local_names)
+        latest_versions = self.cache.get_latest_versions()
+        missing = [name for name in names if name not in latest_versions]
+        if missing:
+            fetched = self.fetch_pypi_info(missing)
+            self.cache.set_many(fetched)
+            latest_versions.update((name, info['latest_version']) for name, info in fetched.items())
+
+        package_info = []
+        max_name_length = max_version_length = 0
+        for name, version in details:
+            # Editable, VCS and local file installs are not tracked against PyPI
+            row = (name, version, None if name in local_names else latest_versions.get(name))
+            package_info.append(row)
+            max_name_length = max(max_name_length, len(name))
+            max_version_length = max(max_version_length, len(str(version)), len(str(row[2] or '')))
+
+        current_template = f"{{name:<{max_name_length}}} {{installed:>{max_version_length}}}"
+        upgrade_template = current_template + f" → {{latest:>{max_version_length}}}"
 
         menu_items = []
-        max_name_length = max(len(name) for name, _, _ in package_info)
-        max_version_length = max(max(len(str(installed)), len(str(latest) or ''))
-                                 for _, installed, latest in package_info)
-
         for name, installed_version, latest_version in package_info:
-            name_formatted = name.ljust(max_name_length)
-            installed_formatted = str(installed_version).rjust(max_version_length)
-
-            if latest_version and latest_version != installed_version:
-                latest_formatted = str(latest_version).rjust(max_version_length)
-                status = f"{name_formatted} {installed_formatted} → {latest_formatted}"
-            else:
-                status = f"{name_formatted} {installed_formatted}"
-
+            row_key = (installed_version, latest_version, max_name_length, max_version_length)
+            cached = self._format_cache.get(name)
+            if cached and cached[0] == row_key:
+                menu_items.append(cached[1])
+                continue
+
+            needs_upgrade = bool(latest_version) and latest_version != installed_version
+            template = upgrade_template if needs_upgrade else current_template
+            status = template.format_map({"name": name, "installed": str(installed_version),
+                                          "latest": str(latest_version)})
+
+            self._format_cache[name] = (row_key, status)
             menu_items.append(status)
 
+        self._menu_packages = packages
+        self._menu_items = menu_items
+        self._package_info = package_info
         clear_screen()
         return menu_items
 
@@ -127,6 +335,7 @@ class PackageManager:
         """Upgrade a package to its latest version."""
         try:
             subprocess.check_call([sys.executable, '-m', 'pip', 'install', '--upgrade', package_name])
+            self._invalidate(package_name)
             logging.info(f"Successfully upgraded {package_name}")
             print(f"{Fore.GREEN}Successfully upgraded {package_name}{Style.RESET_ALL}")
             return True
@@ -136,10 +345,35 @@ class PackageManager:
             input("Press Enter to continue...")
             return False
 
+    def get_outdated_packages(self) -> List[str]:
+        """Return the names of listed packages that have a newer version on PyPI."""
+        return [name for name, installed, latest in self._package_info
+                if latest and is_newer_version(latest, installed)]
+
+    def upgrade_packages(self, package_names: List[str]) -> bool:
+        """Upgrade several packages to their latest versions with a single pip run."""
+        try:
+            subprocess.check_call([sys.executable, '-m', 'pip', 'install', '--upgrade', *package_names])
+            for package_name in package_names:
+                self._invalidate(package_name)
+            logging.info(f"Successfully upgraded {', '.join(package_names)}")
+            print(f"{Fore.GREEN}Successfully upgraded {len(package_names)} packages{Style.RESET_ALL}")
+            return True
+        except subprocess.CalledProcessError as e:
+            # pip may have upgraded some packages before failing
+            for package_name in package_names:
+                self._invalidate(package_name)
+            logging.error(f"Failed to upgrade {', '.join(package_names)}: {str(e)}")
+            print(f"{Fore.RED}Failed to upgrade packages{Style.RESET_ALL}")
+            input("Press Enter to continue...")
+            return False
+
     def downgrade_package(self, package_name: str) -> bool:
         """Downgrade a package to a selected earlier version."""
         print(f"Fetching available versions for {package_name}...")
-        pypi_info = self.cache.get(package_name) or self.get_pypi_info(package_name)
+        pypi_info = self.cache.get(package_name)
+        if not pypi_info or 'all_versions' not in pypi_info:
+            pypi_info = self.get_pypi_info(package_name)
 
         if not pypi_info:
             print(f"{Fore.RED}No versions available for {package_name}{Style.RESET_ALL}")
@@ -147,8 +381,9 @@ class PackageManager:
             return False
 
         versions = ["Back"] + pypi_info['all_versions']
-        current_version = next((p.version for p in self.get_installed_packages() if p.metadata['Name'] == package_name),
-                               None)
+        if not self._installed_by_name:
+            self.get_installed_packages()
+        current_version = self._installed_by_name.get(package_name)
 
         terminal_menu = TerminalMenu(
             versions,
@@ -176,6 +411,7 @@ class PackageManager:
                 capture_output=True,
                 text=True
             )
+            self._invalidate(package_name)
             logging.info(f"Successfully installed {package_name} version {version}")
             print(f"{Fore.GREEN}Successfully installed {package_name} version {version}{Style.RESET_ALL}")
             return True
@@ -192,6 +428,7 @@ class PackageManager:
         """Uninstall a package."""
         try:
             subprocess.check_call([sys.executable, '-m', 'pip', 'uninstall', '-y', package_name])
+            self._invalidate(package_name)
             logging.info(f"Successfully uninstalled {package_name}")
             print(f"{Fore.GREEN}Successfully uninstalled {package_name}{Style.RESET_ALL}")
             return True
@@ -202,9 +439,94 @@ class PackageManager:
             return False
 
 
+@functools.lru_cache(maxsize=None)
+def pip_has_extra_index() -> bool:
+    """Check whether pip is configured with an index other than, or in addition to, PyPI."""
+    index_urls = []
+    try:
+        output = subprocess.check_output([sys.executable, '-m', 'pip', 'config', 'list'], stderr=subprocess.DEVNULL)
+    except subprocess.CalledProcessError:
+        output = b''
+    # Lines look like "global.index-url='https://...'", with PIP_* environment variables listed under ":env:";
+    # extra-index-url may hold several URLs
+    for line in output.decode().splitlines():
+        key, _, value = line.partition('=')
+        if key.endswith('index-url'):
+            index_urls.extend(value.strip("'\"").split())
+    return any(url.rstrip('/') not in PYPI_INDEX_URLS for url in index_urls)
+
+
+def distribution_details(package: importlib.metadata.Distribution) -> Tuple[str, str]:
+    """Return the name and version of a distribution, reading its METADATA file only once."""
+    metadata = package.metadata
+    return metadata['Name'], metadata['Version']
+
+
+def is_local_install(package: importlib.metadata.Distribution) -> bool:
+    """Check whether a distribution was installed in editable mode, from VCS or from a local file (PEP 610)."""
+    direct_url = package.read_text('direct_url.json')
+    if not direct_url:
+        return False
+    try:
+        info = orjson.loads(direct_url)
+    except orjson.JSONDecodeError:
+        return False
+    return (info.get('dir_info', {}).get('editable', False) or 'vcs_info' in info
+            or info.get('url', '').startswith('file://'))
+
+
+# simdjson parsers are reusable but not thread safe, so keep one per thread
+_json_parsers = threading.local()
+
+
+def parse_pypi_json(content: bytes) -> Dict:
+    """Extract the latest and all release versions from a PyPI JSON API response.
+
+    Only `info.version` and the keys of `releases` are needed, so when simdjson is available the per-release file
+    lists are skipped rather than turned into Python objects.
+    """
+    try:
+        if simdjson is not None:
+            if not hasattr(_json_parsers, 'parser'):
+                _json_parsers.parser = simdjson.Parser()
+            doc = _json_parsers.parser.parse(content)
+            latest_version = doc['info']['version']
+            releases = list(doc['releases'].keys())
+        else:
+            data = orjson.loads(content)
+            latest_version, releases = data['info']['version'], list(data['releases'].keys())
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Unexpected PyPI response: {str(e)}") from e
+
+    if not isinstance(latest_version, str):
+        raise ValueError("PyPI response has no info.version")
+    return {"latest_version": latest_version, "all_versions": sort_versions(releases)}
+
+
+def is_newer_version(latest: str, installed: str) -> bool:
+    """Check whether `latest` is a newer version than `installed`; versions that do not parse are never newer."""
+    try:
+        return Version(latest) > Version(installed)
+    except InvalidVersion:
+        return False
+
+
+def sort_versions(versions) -> List[str]:
+    """Sort version strings newest first, skipping any that are not PEP 440 compliant."""
+    parsed = []
+    for version in versions:
+        try:
+            parsed.append((Version(version), version))
+        except InvalidVersion:
+            continue
+    return [version for _, version in sorted(parsed, reverse=True)]
+
+
 def clear_screen() -> None:
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # colorama translates these escape codes on Windows consoles, so no shell command is needed
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
 
 def package_options(manager: PackageManager, package_name: str) -> bool:
@@ -230,6 +552,29 @@ def package_options(manager: PackageManager, package_name: str) -> bool:
             return True
 
 
+def upgrade_outdated(manager: PackageManager) -> bool:
+    """Let the user pick outdated packages and upgrade them all at once."""
+    outdated = manager.get_outdated_packages()
+    if not outdated:
+        print(f"{Fore.GREEN}All packages are up to date{Style.RESET_ALL}")
+        input("Press Enter to continue...")
+        return False
+
+    terminal_menu = TerminalMenu(
+        outdated,
+        title="Select packages to upgrade (Space to toggle, Enter to confirm)",
+        multi_select=True,
+        preselected_entries=list(range(len(outdated))),
+        show_multi_select_hint=True,
+        **MENU_STYLE
+    )
+    choice_indices = terminal_menu.show()
+    if not choice_indices:
+        return False
+
+    return manager.upgrade_packages([outdated[index] for index in choice_indices])
+
+
 def main() -> None:
     """Main function to run the package manager."""
     manager = PackageManager()
@@ -237,8 +582,7 @@ def main() -> None:
     while True:
         clear_screen()
         packages = manager.get_installed_packages()
-        menu_items = manager.display_packages(packages)
-        menu_items.append("Quit")
+        menu_items = manager.display_packages(packages) + ["Upgrade All Outdated", "Quit"]
 
         # Create a copy of MENU_STYLE and update it with search-specific settings
         menu_style = MENU_STYLE.copy()
@@ -259,7 +603,11 @@ def main() -> None:
             print("Exiting the package manager.")
             break
 
-        selected_package = packages[choice_index].metadata['Name']
+        if menu_items[choice_index] == "Upgrade All Outdated":
+            upgrade_outdated(manager)
+            continue
+
+        selected_package, _ = distribution_details(packages[choice_index])
         if package_options(manager, selected_package):
             continue  # Refresh main menu
 